@@ -1,4 +1,4 @@
-import matplotlib.pyplot as plt
+import numpy as np
 
 # ── Exact data from CrossingBench CSVs ──────────────────────────────────
 
@@ -18,10 +18,6 @@ cf_memory = [0.004859, 0.009671, 0.019157, 0.037594, 0.072464, 0.135135,
 
 # ── Uncertainty bands: ±20% on β ────────────────────────────────────────
 
-def crossing_fraction(beta, bytes_cross_val, c_intra):
-    c_cross = beta * bytes_cross_val
-    return c_cross / (c_intra + c_cross)
-
 c_intra_analog = 26.2144      # 262144 * 0.1e-3 ... actually 262144 * 0.0001 = 26.2144
 c_intra_digital = 65536.0     # 262144 * 0.25
 
@@ -31,76 +27,86 @@ beta_memory = 1.25
 
 uncertainty = 0.20  # ±20%
 
-def get_band(beta, c_intra):
-    lo = [crossing_fraction(beta * (1 - uncertainty), bc, c_intra) for bc in bytes_cross]
-    hi = [crossing_fraction(beta * (1 + uncertainty), bc, c_intra) for bc in bytes_cross]
-    return lo, hi
-
-analog_lo, analog_hi = get_band(beta_analog, c_intra_analog)
-chiplet_lo, chiplet_hi = get_band(beta_chiplet, c_intra_digital)
-memory_lo, memory_hi = get_band(beta_memory, c_intra_digital)
-
-# ── Plot ────────────────────────────────────────────────────────────────
-
-plt.rcParams.update({
-    'font.family': 'serif',
-    'font.size': 12,
-    'axes.linewidth': 0.8,
-    'xtick.major.width': 0.8,
-    'ytick.major.width': 0.8,
-})
-
-fig, ax = plt.subplots(figsize=(11, 6.5))
-
-# Uncertainty bands
-ax.fill_between(bytes_cross, analog_lo, analog_hi, alpha=0.15, color='#1f77b4', linewidth=0)
-ax.fill_between(bytes_cross, chiplet_lo, chiplet_hi, alpha=0.15, color='#e8811a', linewidth=0)
-ax.fill_between(bytes_cross, memory_lo, memory_hi, alpha=0.15, color='#2ca02c', linewidth=0)
-
-# Main curves
-ax.plot(bytes_cross, cf_analog, 'o-', color='#1f77b4', linewidth=2.2, markersize=7,
-        label=r'Analog (β = 3.20 pJ/B, compute = 0.1 pJ/B)', zorder=5)
-ax.plot(bytes_cross, cf_chiplet, 's-', color='#e8811a', linewidth=2.2, markersize=7,
-        label=r'Chiplet (β = 5.00 pJ/B, compute = 0.25 pJ/B)', zorder=5)
-ax.plot(bytes_cross, cf_memory, '^-', color='#2ca02c', linewidth=2.2, markersize=7,
-        label=r'Memory (β = 1.25 pJ/B, compute = 0.25 pJ/B)', zorder=5)
-
-# 50% threshold line
-ax.axhline(y=0.5, color='gray', linestyle='--', linewidth=1.0, alpha=0.7, zorder=2)
-ax.text(bytes_cross[-1] * 1.05, 0.505, 'ε = 0.5 transition',
-        fontsize=10, color='gray', va='bottom', ha='right', style='italic')
-
-# Axes
-ax.set_xscale('log')
-ax.set_xlabel(r'Crossing Volume $V_b$ (Bytes)', fontsize=13)
-ax.set_ylabel(r'Crossing Fraction  ($E_{\mathrm{cross}} \,/\, E_{\mathrm{total}}$)', fontsize=13)
-ax.set_title(r'Domain Crossing Law: Energy Dominance by Boundary Cost $\beta$',
-             fontsize=14, fontweight='bold', pad=12)
-
-ax.set_ylim(-0.02, 1.05)
-ax.set_xlim(bytes_cross[0] * 0.7, bytes_cross[-1] * 1.5)
-
-# Grid
-ax.grid(True, which='major', linestyle='-', alpha=0.15)
-ax.grid(True, which='minor', linestyle='-', alpha=0.07)
-
-# Legend
-ax.legend(loc='lower right', fontsize=10, framealpha=0.9, edgecolor='0.8')
-
-# Caption below figure
-caption = (
-    r"$\bf{Figure\ 1.}$ Crossing energy fraction vs. crossing volume for three boundary types. "
-    "Analog CIM uses an ultra-low intra-domain compute cost (0.1 pJ/B); chiplet and memory\n"
-    r"boundaries share a digital compute baseline (0.25 pJ/B)."
-    r" Shaded regions: ±20% uncertainty on $\beta$. "
-    "Data: CrossingBench sweep with 262 144 B compute volume."
-)
-fig.text(0.5, -0.01, caption, ha='center', fontsize=9.5, color='0.3',
-         wrap=True, linespacing=1.4)
-
-plt.tight_layout()
-plt.savefig('/home/claude/crossing_dominance.png', dpi=300, bbox_inches='tight',
-            facecolor='white', pad_inches=0.3)
-plt.savefig('/home/claude/crossing_dominance.pdf', bbox_inches='tight',
-            facecolor='white', pad_inches=0.3)
-print("Done – PNG and PDF saved.")
+# One row per scenario (analog, chiplet, memory), one column per byte count:
+# the whole band table is a single broadcast evaluation of
+# c_cross / (c_intra + c_cross).
+bytes_arr = np.asarray(bytes_cross, dtype=float)
+betas = np.array([beta_analog, beta_chiplet, beta_memory])[:, None]
+c_intras = np.array([c_intra_analog, c_intra_digital, c_intra_digital])[:, None]
+
+c_cross_lo = betas * (1 - uncertainty) * bytes_arr
+c_cross_hi = betas * (1 + uncertainty) * bytes_arr
+band_lo = c_cross_lo / (c_intras + c_cross_lo)
+band_hi = c_cross_hi / (c_intras + c_cross_hi)
+
+analog_lo, chiplet_lo, memory_lo = band_lo
+analog_hi, chiplet_hi, memory_hi = band_hi
+
+if __name__ == "__main__":
+    # ── Plot ──────────────────────────────────────────────────────────────
+
+    import matplotlib.pyplot as plt
+
+    plt.rcParams.update({
+        'font.family': 'serif',
+        'font.size': 12,
+        'axes.linewidth': 0.8,
+        'xtick.major.width': 0.8,
+        'ytick.major.width': 0.8,
+    })
+
+    fig, ax = plt.subplots(figsize=(11, 6.5))
+
+    # Uncertainty bands
+    ax.fill_between(bytes_cross, analog_lo, analog_hi, alpha=0.15, color='#1f77b4', linewidth=0)
+    ax.fill_between(bytes_cross, chiplet_lo, chiplet_hi, alpha=0.15, color='#e8811a', linewidth=0)
+    ax.fill_between(bytes_cross, memory_lo, memory_hi, alpha=0.15, color='#2ca02c', linewidth=0)
+
+    # Main curves
+    ax.plot(bytes_cross, cf_analog, 'o-', color='#1f77b4', linewidth=2.2, markersize=7,
+            label=r'Analog (β = 3.20 pJ/B, compute = 0.1 pJ/B)', zorder=5)
+    ax.plot(bytes_cross, cf_chiplet, 's-', color='#e8811a', linewidth=2.2, markersize=7,
+            label=r'Chiplet (β = 5.00 pJ/B, compute = 0.25 pJ/B)', zorder=5)
+    ax.plot(bytes_cross, cf_memory, '^-', color='#2ca02c', linewidth=2.2, markersize=7,
+            label=r'Memory (β = 1.25 pJ/B, compute = 0.25 pJ/B)', zorder=5)
+
+    # 50% threshold line
+    ax.axhline(y=0.5, color='gray', linestyle='--', linewidth=1.0, alpha=0.7, zorder=2)
+    ax.text(bytes_cross[-1] * 1.05, 0.505, 'ε = 0.5 transition',
+            fontsize=10, color='gray', va='bottom', ha='right', style='italic')
+
+    # Axes
+    ax.set_xscale('log')
+    ax.set_xlabel(r'Crossing Volume $V_b$ (Bytes)', fontsize=13)
+    ax.set_ylabel(r'Crossing Fraction  ($E_{\mathrm{cross}} \,/\, E_{\mathrm{total}}$)',
+                  fontsize=13)
+    ax.set_title(r'Domain Crossing Law: Energy Dominance by Boundary Cost $\beta$',
+                 fontsize=14, fontweight='bold', pad=12)
+
+    ax.set_ylim(-0.02, 1.05)
+    ax.set_xlim(bytes_cross[0] * 0.7, bytes_cross[-1] * 1.5)
+
+    # Grid
+    ax.grid(True, which='major', linestyle='-', alpha=0.15)
+    ax.grid(True, which='minor', linestyle='-', alpha=0.07)
+
+    # Legend
+    ax.legend(loc='lower right', fontsize=10, framealpha=0.9, edgecolor='0.8')
+
+    # Caption below figure
+    caption = (
+        r"$\bf{Figure\ 1.}$ Crossing energy fraction vs. crossing volume for three boundary types. "
+        "Analog CIM uses an ultra-low intra-domain compute cost (0.1 pJ/B); chiplet and memory\n"
+        r"boundaries share a digital compute baseline (0.25 pJ/B)."
+        r" Shaded regions: ±20% uncertainty on $\beta$. "
+        "Data: CrossingBench sweep with 262 144 B compute volume."
+    )
+    fig.text(0.5, -0.01, caption, ha='center', fontsize=9.5, color='0.3',
+             wrap=True, linespacing=1.4)
+
+    plt.tight_layout()
+    plt.savefig('/home/claude/crossing_dominance.png', dpi=300, bbox_inches='tight',
+                facecolor='white', pad_inches=0.3)
+    plt.savefig('/home/claude/crossing_dominance.pdf', bbox_inches='tight',
+                facecolor='white', pad_inches=0.3)
+    print("Done – PNG and PDF saved.")
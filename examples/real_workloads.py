@@ -34,6 +34,8 @@ import json
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Allow running from repo root without install
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
@@ -82,7 +84,13 @@ def resnet50():
         {"name": "fc",        "in_c": 2048, "out_c": 1000, "h": 1,   "macs": 2_048_000},
     ]
 
-    total_macs = sum(layer["macs"] for layer in layers)
+    # Column view of the layer table: one int64 array per field.
+    in_c = np.array([layer["in_c"] for layer in layers], dtype=np.int64)
+    out_c = np.array([layer["out_c"] for layer in layers], dtype=np.int64)
+    h = np.array([layer["h"] for layer in layers], dtype=np.int64)
+    macs = np.array([layer["macs"] for layer in layers], dtype=np.int64)
+
+    total_macs = int(macs.sum())
     print(f"\n  Total MACs: {total_macs / 1e9:.2f} GMAC")
     print("  Parameters: 25.6 MB (INT8)")
 
@@ -95,13 +103,11 @@ def resnet50():
     print(f"  {'─' * 68}")
 
     tile = 128
-    total_adc = total_dac = 0
-    for layer in layers:
-        in_tiles = max(1, -(-layer["in_c"] // tile))
-        out_tiles = max(1, -(-layer["out_c"] // tile))
-        spatial = layer["h"] * layer["h"]
-        total_dac += spatial * in_tiles * tile
-        total_adc += spatial * out_tiles * tile
+    in_tiles = np.maximum(1, -(-in_c // tile))
+    out_tiles = np.maximum(1, -(-out_c // tile))
+    spatial = h * h
+    total_dac = int((spatial * in_tiles * tile).sum())
+    total_adc = int((spatial * out_tiles * tile).sum())
 
     cross_bytes = total_adc + total_dac
     compute_bytes = total_macs
@@ -183,29 +189,36 @@ def transformer():
         f"  {'─'*6}  {'─'*6}  {'─'*15}"
     )
 
-    results = []
-    for seq in [64, 128, 256, 512, 1024, 2048, 4096]:
-        qkv = 3 * seq * d * d
-        attn = heads * seq * seq * d_h
-        av = attn
-        out_p = seq * d * d
-        macs = qkv + attn + av + out_p
-
-        weights = 4 * d * d
-        kv_cache = 2 * heads * seq * d_h
-        acts = seq * d * 3
-        dram = weights + kv_cache + acts
-
-        e_comp = macs * COSTS["digital_compute"]
-        e_mem = dram * COSTS["memory_crossing"]
-        mem_f = e_mem / (e_comp + e_mem)
-
-        n_matmuls = 4
-        cim_cross = n_matmuls * (seq * d + seq * d)
-        e_cim_comp = macs * COSTS["analog_compute"]
-        e_cim_cross = cim_cross * COSTS["analog_crossing"]
-        cim_f = e_cim_cross / (e_cim_comp + e_cim_cross)
+    # Every quantity is a closed-form shape function of seq, so evaluate the
+    # whole sweep as array ops and loop only to print.
+    seq = np.array([64, 128, 256, 512, 1024, 2048, 4096], dtype=np.int64)
+
+    qkv = 3 * seq * d * d
+    attn = heads * seq * seq * d_h
+    av = attn
+    out_p = seq * d * d
+    macs = qkv + attn + av + out_p
 
+    weights = 4 * d * d
+    kv_cache = 2 * heads * seq * d_h
+    acts = seq * d * 3
+    dram = weights + kv_cache + acts
+
+    e_comp = macs * COSTS["digital_compute"]
+    e_mem = dram * COSTS["memory_crossing"]
+    mem_frac = e_mem / (e_comp + e_mem)
+
+    n_matmuls = 4
+    cim_cross = n_matmuls * (seq * d + seq * d)
+    e_cim_comp = macs * COSTS["analog_compute"]
+    e_cim_cross = cim_cross * COSTS["analog_crossing"]
+    cim_frac = e_cim_cross / (e_cim_comp + e_cim_cross)
+
+    results = []
+    for s_len, n_macs, n_dram, mem_f, cim_f in zip(
+        seq.tolist(), macs.tolist(), dram.tolist(),
+        mem_frac.tolist(), cim_frac.tolist(),
+    ):
         if mem_f > 0.7 and cim_f > 0.7:
             regime = "CROSSING"
         elif mem_f > 0.3 or cim_f > 0.7:
@@ -214,11 +227,11 @@ def transformer():
             regime = "COMPUTE"
 
         print(
-            f"  {seq:>6}  {macs:>14,}  {dram // 1024:>8,}"
+            f"  {s_len:>6}  {n_macs:>14,}  {n_dram // 1024:>8,}"
             f"  {mem_f * 100:>5.1f}%  {cim_f * 100:>5.1f}%  {regime}"
         )
         results.append({
-            "seq_len": seq, "mem_frac": mem_f, "cim_frac": cim_f,
+            "seq_len": s_len, "mem_frac": mem_f, "cim_frac": cim_f,
         })
 
     print(
@@ -2,16 +2,21 @@ from __future__ import annotations
 
 import argparse
 import json
+import math
+from collections.abc import Iterable, Iterator
 
 from .core import (
     DEFAULT_BOUNDARIES,
     DEFAULT_COMPUTE,
     BoundaryCost,
     ComputeCost,
+    SweepResult,
     compare_baseline_vs_reduced,
-    sweep,
+    compare_sweep,
+    iter_sweep,
+    transition_point,
 )
-from .io import write_csv
+from .io import write_csv, write_parquet
 
 
 def _add_common(parser: argparse.ArgumentParser) -> None:
@@ -45,6 +50,44 @@ def _add_common(parser: argparse.ArgumentParser) -> None:
     )
 
 
+class _SweepRanges:
+    """Running min/max of crossing fraction and local epsilon over sweep chunks."""
+
+    def __init__(self) -> None:
+        self.frac_min = self.eps_min = math.inf
+        self.frac_max = self.eps_max = -math.inf
+        self.has_eps = False
+
+    def track(self, chunks: Iterable[SweepResult]) -> Iterator[SweepResult]:
+        first = True
+        for chunk in chunks:
+            frac = chunk.crossing_fraction
+            self.frac_min = min(self.frac_min, min(frac))
+            self.frac_max = max(self.frac_max, max(frac))
+
+            # The first sweep point has no left neighbour, so no epsilon.
+            eps = chunk.epsilon_local[1:] if first else chunk.epsilon_local
+            first = False
+            if eps:
+                self.has_eps = True
+                self.eps_min = min(self.eps_min, min(eps))
+                self.eps_max = max(self.eps_max, max(eps))
+
+            yield chunk
+
+
+def _float_list(text: str) -> list[float]:
+    try:
+        values = [float(v) for v in text.split(",") if v.strip()]
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(
+            f"expected comma-separated numbers, got {text!r}"
+        ) from e
+    if not values:
+        raise argparse.ArgumentTypeError("expected at least one number")
+    return values
+
+
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="CrossingBench")
     sub = p.add_subparsers(dest="cmd", required=True)
@@ -60,7 +103,10 @@ def build_parser() -> argparse.ArgumentParser:
     s.add_argument("--cross_min", type=int, default=256)
     s.add_argument("--cross_max", type=int, default=524_288)
     s.add_argument("--steps", type=int, default=12)
-    s.add_argument("--out", type=str, default="sweep.csv")
+    s.add_argument(
+        "--out", type=str, default="sweep.csv",
+        help="Output path; a .parquet suffix writes Parquet (needs pyarrow)",
+    )
     s.add_argument(
         "--json", type=str, default=None,
         help="Optional JSON summary output path",
@@ -76,10 +122,25 @@ def build_parser() -> argparse.ArgumentParser:
     )
     c.add_argument("--cross_bytes", type=int, default=196_608)
     c.add_argument("--reduce_factor", type=float, default=3.0)
+    c.add_argument(
+        "--reduce_factors", type=_float_list, default=None,
+        help="Comma-separated reduce factors to compare against one "
+        "baseline (overrides --reduce_factor)",
+    )
     c.add_argument(
         "--json", type=str, default=None, help="Optional JSON output path",
     )
 
+    t = sub.add_parser(
+        "transition",
+        help="Closed-form crossing volume where crossing energy equals compute",
+    )
+    _add_common(t)
+    t.add_argument(
+        "--bytes", type=int, default=262_144,
+        help="Intra-domain compute bytes",
+    )
+
     return p
 
 
@@ -118,7 +179,7 @@ def main() -> None:
     compute, boundary = _resolve_costs(args)
 
     if args.cmd == "sweep":
-        rows = sweep(
+        chunks = iter_sweep(
             bytes_compute=args.bytes,
             cross_min=args.cross_min,
             cross_max=args.cross_max,
@@ -127,10 +188,14 @@ def main() -> None:
             compute=compute,
             boundary=boundary,
         )
-        write_csv(args.out, rows)
-
-        eps_vals = [r.epsilon_local for r in rows[1:]]
-        frac_vals = [r.crossing_fraction for r in rows]
+        # Stream chunks straight to the CSV, keeping only running ranges.
+        ranges = _SweepRanges()
+        writer = (
+            write_parquet if args.out.endswith(".parquet") else write_csv
+        )
+        writer(args.out, ranges.track(chunks))
+        eps_min = ranges.eps_min if ranges.has_eps else 0.0
+        eps_max = ranges.eps_max if ranges.has_eps else 0.0
 
         summary = {
             "boundary": args.boundary,
@@ -143,10 +208,10 @@ def main() -> None:
             "cross_max": args.cross_max,
             "steps": args.steps,
             "bytes_per_event": args.bytes_per_event,
-            "crossing_fraction_min": min(frac_vals),
-            "crossing_fraction_max": max(frac_vals),
-            "epsilon_local_min": min(eps_vals) if eps_vals else 0.0,
-            "epsilon_local_max": max(eps_vals) if eps_vals else 0.0,
+            "crossing_fraction_min": ranges.frac_min,
+            "crossing_fraction_max": ranges.frac_max,
+            "epsilon_local_min": eps_min,
+            "epsilon_local_max": eps_max,
         }
 
         print(f"Wrote {args.out}")
@@ -162,9 +227,7 @@ def main() -> None:
         print(
             f"Crossing fraction range: {frac_min:.3f} .. {frac_max:.3f}"
         )
-        if eps_vals:
-            eps_min = summary["epsilon_local_min"]
-            eps_max = summary["epsilon_local_max"]
+        if ranges.has_eps:
             print(
                 f"Epsilon local range:     {eps_min:.3f} .. {eps_max:.3f}"
             )
@@ -173,6 +236,34 @@ def main() -> None:
             with open(args.json, "w", encoding="utf-8") as f:
                 json.dump(summary, f, indent=2)
 
+    elif args.cmd == "compare" and args.reduce_factors is not None:
+        out = compare_sweep(
+            bytes_compute=args.bytes,
+            cross_bytes=args.cross_bytes,
+            bytes_per_event=args.bytes_per_event,
+            reduce_factors=args.reduce_factors,
+            compute=compute,
+            boundary=boundary,
+        )
+
+        # human-readable output
+        for k in ["baseline_total_pj", "baseline_cross_frac"]:
+            print(f"{k}: {out[k]:.6f}")
+        cols = [
+            "reduce_factor",
+            "reduced_total_pj",
+            "reduced_cross_frac",
+            "energy_gain_x",
+            "elasticity_effective",
+        ]
+        print("  ".join(f"{k:>20}" for k in cols))
+        for row in zip(*(out[k] for k in cols)):
+            print("  ".join(f"{v:>20.6f}" for v in row))
+
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(out, f, indent=2)
+
     elif args.cmd == "compare":
         out = compare_baseline_vs_reduced(
             bytes_compute=args.bytes,
@@ -198,5 +289,14 @@ def main() -> None:
             with open(args.json, "w", encoding="utf-8") as f:
                 json.dump(out, f, indent=2)
 
+    elif args.cmd == "transition":
+        b = transition_point(
+            bytes_compute=args.bytes,
+            bytes_per_event=args.bytes_per_event,
+            compute=compute,
+            boundary=boundary,
+        )
+        print(f"transition_bytes_cross: {b}")
+
     else:
         raise SystemExit("Unknown command")
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import functools
 import math
+import sys
+from array import array
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 
+# dataclass(slots=True) needs Python 3.10+; on 3.9 instances keep a __dict__.
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **_SLOTS)
 class BoundaryCost:
     """Crossing cost model.
 
@@ -15,7 +22,7 @@ class BoundaryCost:
     beta_pj_per_byte: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ComputeCost:
     """Compute cost model.
 
@@ -40,14 +47,14 @@ DEFAULT_COMPUTE: dict[str, ComputeCost] = {
 }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ProgramPoint:
     bytes_compute: int
     bytes_cross: int
     events_cross: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ResultPoint:
     bytes_compute: int
     bytes_cross: int
@@ -59,17 +66,62 @@ class ResultPoint:
     epsilon_local: float
 
 
+@dataclass(frozen=True, **_SLOTS)
+class SweepResult:
+    """Sweep output stored column-wise, one typed array per CSV column.
+
+    Indexing and iteration yield :class:`ResultPoint` rows, so code written
+    against the former ``list[ResultPoint]`` return type keeps working.
+    Slicing returns another ``SweepResult`` over the sliced columns; rows
+    are only materialized when a caller asks for one.
+    """
+
+    bytes_compute: array
+    bytes_cross: array
+    events_cross: array
+    c_intra_pj: array
+    c_cross_pj: array
+    c_total_pj: array
+    crossing_fraction: array
+    epsilon_local: array
+
+    @property
+    def columns(self) -> tuple[array, ...]:
+        return (
+            self.bytes_compute,
+            self.bytes_cross,
+            self.events_cross,
+            self.c_intra_pj,
+            self.c_cross_pj,
+            self.c_total_pj,
+            self.crossing_fraction,
+            self.epsilon_local,
+        )
+
+    def __len__(self) -> int:
+        return len(self.bytes_cross)
+
+    def __iter__(self) -> Iterator[ResultPoint]:
+        return map(ResultPoint, *self.columns)
+
+    def __getitem__(self, i: int | slice) -> ResultPoint | SweepResult:
+        if isinstance(i, slice):
+            return SweepResult(*(c[i] for c in self.columns))
+        return ResultPoint(*(c[i] for c in self.columns))
+
+
 def energy_intra(bytes_compute: int, compute: ComputeCost) -> float:
-    return float(bytes_compute) * compute.pj_per_byte
+    return float(bytes_compute * compute.pj_per_byte)
 
 
 def energy_cross(
     bytes_cross: int, events_cross: int, boundary: BoundaryCost,
 ) -> float:
-    return (
-        float(events_cross) * boundary.alpha_pj_per_event
-        + float(bytes_cross) * boundary.beta_pj_per_byte
-    )
+    alpha = boundary.alpha_pj_per_event
+    if alpha == 0.0:
+        # All default boundaries are per-byte only.
+        return float(bytes_cross * boundary.beta_pj_per_byte)
+    return float(events_cross * alpha + bytes_cross * boundary.beta_pj_per_byte)
 
 
 def crossing_fraction(c_cross: float, c_total: float) -> float:
@@ -95,109 +147,292 @@ def run_point(
     return c_intra, c_cross, c_total, frac
 
 
-def sweep(
-    *,
+# Whole grids up to this many points are memoized by _log_grid(). Larger grids
+# and iter_sweep() chunks bypass the cache: chunks are used once, and caching
+# them would pin a streamed sweep in memory. The cache therefore holds at most
+# 64 grids of 4096 points, a few MB.
+_GRID_CACHE_POINTS = 4096
+
+
+@functools.lru_cache(maxsize=64)
+def _log_grid(
+    cross_min: int, cross_max: int, steps: int, start: int, stop: int,
+) -> tuple[int, ...]:
+    """Points [start, stop) of the log-spaced grid from cross_min to cross_max.
+
+    Values are rounded to whole bytes. The grid depends only on its integer
+    arguments, so studies that repeat a volume range (every boundary over the
+    same sweep, say) reuse it from the cache.
+    """
+
+    last = steps - 1
+    exp = math.exp
+    log_min = math.log(cross_min)
+    log_span = math.log(cross_max) - log_min
+    return tuple([
+        int(round(exp(log_min + (i / last) * log_span)))
+        for i in range(start, stop)
+    ])
+
+
+def _sweep_kernel(
+    bytes_cross: Sequence[int],
+    c_intra: float,
+    bytes_per_event: int,
+    alpha: float,
+    beta: float,
+) -> tuple[array, ...]:
+    """Scalar core of :func:`sweep`, free of dataclass and attribute access.
+
+    Returns the columns: bytes_cross, events_cross, c_cross_pj, c_total_pj,
+    crossing_fraction, epsilon_local. The compute term is constant across
+    the sweep and is passed in precomputed.
+    """
+
+    log = math.log
+    steps = len(bytes_cross)
+
+    # Integer ceiling division; at least one event per crossing.
+    events_cross = [-(-b // bytes_per_event) or 1 for b in bytes_cross]
+    if not isinstance(bytes_per_event, int):
+        # A float divisor gives float counts; the column stores whole events.
+        events_cross = [int(ev) for ev in events_cross]
+    if alpha == 0.0:
+        c_cross = [b * beta for b in bytes_cross]
+    else:
+        c_cross = [
+            ev * alpha + b * beta
+            for b, ev in zip(bytes_cross, events_cross)
+        ]
+    c_total = [c_intra + c for c in c_cross]
+    frac = [c / t if t > 0 else 0.0 for c, t in zip(c_cross, c_total)]
+
+    # Same estimate as log_slope() between neighbours, but each log is taken
+    # once per point instead of twice. The grid is rounded to whole bytes, so
+    # the log step is not constant across the grid and must be measured.
+    # A cross_min below half a byte rounds to 0-byte points; like log_slope(),
+    # give them epsilon 0.0.
+    log_b = [log(b) if b > 0 else 0.0 for b in bytes_cross]
+    log_t = [log(t) if t > 0 else 0.0 for t in c_total]
+    eps = [0.0] * steps
+    for i in range(1, steps):
+        if (
+            bytes_cross[i] != bytes_cross[i - 1]
+            and bytes_cross[i - 1] > 0 and bytes_cross[i] > 0
+            and c_total[i] > 0 and c_total[i - 1] > 0
+        ):
+            eps[i] = (log_t[i] - log_t[i - 1]) / (log_b[i] - log_b[i - 1])
+
+    return (
+        array("q", bytes_cross),
+        array("q", events_cross),
+        array("d", c_cross),
+        array("d", c_total),
+        array("d", frac),
+        array("d", eps),
+    )
+
+
+def _check_sweep_args(
     bytes_compute: int,
     cross_min: int,
     cross_max: int,
     steps: int,
     bytes_per_event: int,
-    compute: ComputeCost,
-    boundary: BoundaryCost,
-) -> list[ResultPoint]:
-    """Log-spaced sweep of crossing bytes; returns per-point energies and local epsilon."""
+) -> int:
+    """Validate sweep arguments; returns bytes_compute as an int."""
 
+    if bytes_compute != int(bytes_compute):
+        raise ValueError("bytes_compute must be a whole number of bytes")
     if steps < 2:
         raise ValueError("steps must be >= 2")
     if cross_min <= 0 or cross_max <= 0 or cross_min > cross_max:
         raise ValueError("Require 0 < cross_min <= cross_max")
     if bytes_per_event <= 0:
         raise ValueError("bytes_per_event must be > 0")
+    return int(bytes_compute)
 
-    log_min = math.log(cross_min)
-    log_max = math.log(cross_max)
-
-    points: list[ProgramPoint] = []
-    for i in range(steps):
-        t = i / (steps - 1)
-        b = int(round(math.exp(log_min + t * (log_max - log_min))))
-        ev = max(1, int(math.ceil(b / bytes_per_event)))
-        points.append(ProgramPoint(
-            bytes_compute=bytes_compute, bytes_cross=b, events_cross=ev,
-        ))
-
-    energies: list[tuple[ProgramPoint, float, float, float, float]] = []
-    for p in points:
-        c_intra, c_cross, c_total, frac = run_point(p, compute, boundary)
-        energies.append((p, c_intra, c_cross, c_total, frac))
-
-    results: list[ResultPoint] = []
-    for i, (p, c_intra, c_cross, c_total, frac) in enumerate(energies):
-        if i == 0:
-            eps = 0.0
-        else:
-            p_prev, _, _, c_total_prev, _ = energies[i - 1]
-            eps = log_slope(
-                float(p_prev.bytes_cross), float(c_total_prev),
-                float(p.bytes_cross), float(c_total),
-            )
-
-        results.append(
-            ResultPoint(
-                bytes_compute=p.bytes_compute,
-                bytes_cross=p.bytes_cross,
-                events_cross=p.events_cross,
-                c_intra_pj=c_intra,
-                c_cross_pj=c_cross,
-                c_total_pj=c_total,
-                crossing_fraction=frac,
-                epsilon_local=eps,
-            )
+
+def _sweep_chunks(
+    bytes_compute: int,
+    cross_min: int,
+    cross_max: int,
+    steps: int,
+    bytes_per_event: int,
+    compute: ComputeCost,
+    boundary: BoundaryCost,
+    chunk_size: int,
+) -> Iterator[SweepResult]:
+    c_intra = energy_intra(bytes_compute, compute)
+    alpha = boundary.alpha_pj_per_event
+    beta = boundary.beta_pj_per_byte
+
+    # Each chunk after the first is evaluated together with the last point of
+    # the previous one, so its first epsilon is measured across the seam; that
+    # carried point is then dropped from the output.
+    carry: tuple[int, ...] = ()
+    for start in range(0, steps, chunk_size):
+        stop = min(start + chunk_size, steps)
+        make_grid = (
+            _log_grid
+            if start == 0 and stop == steps and steps <= _GRID_CACHE_POINTS
+            else _log_grid.__wrapped__
+        )
+        grid = carry + make_grid(cross_min, cross_max, steps, start, stop)
+        columns = _sweep_kernel(grid, c_intra, bytes_per_event, alpha, beta)
+        if carry:
+            columns = tuple(c[1:] for c in columns)
+        b, ev, c_cross, c_total, frac, eps = columns
+        n = stop - start
+
+        yield SweepResult(
+            bytes_compute=array("q", [bytes_compute]) * n,
+            bytes_cross=b,
+            events_cross=ev,
+            c_intra_pj=array("d", [c_intra]) * n,
+            c_cross_pj=c_cross,
+            c_total_pj=c_total,
+            crossing_fraction=frac,
+            epsilon_local=eps,
         )
+        carry = grid[-1:]
+
+
+def sweep(
+    *,
+    bytes_compute: int,
+    cross_min: int,
+    cross_max: int,
+    steps: int,
+    bytes_per_event: int,
+    compute: ComputeCost,
+    boundary: BoundaryCost,
+) -> SweepResult:
+    """Log-spaced sweep of crossing bytes; returns per-point energies and local epsilon."""
 
-    return results
+    bytes_compute = _check_sweep_args(
+        bytes_compute, cross_min, cross_max, steps, bytes_per_event,
+    )
+    return next(_sweep_chunks(
+        bytes_compute, cross_min, cross_max, steps, bytes_per_event,
+        compute, boundary, chunk_size=steps,
+    ))
 
 
-def compare_baseline_vs_reduced(
+def iter_sweep(
+    *,
+    bytes_compute: int,
+    cross_min: int,
+    cross_max: int,
+    steps: int,
+    bytes_per_event: int,
+    compute: ComputeCost,
+    boundary: BoundaryCost,
+    chunk_size: int = 4096,
+) -> Iterator[SweepResult]:
+    """Same sweep as :func:`sweep`, produced lazily in chunks.
+
+    Yields consecutive :class:`SweepResult` blocks of at most ``chunk_size``
+    points, so memory stays bounded by the chunk size rather than by
+    ``steps``. Concatenated, the chunks equal the result of :func:`sweep`.
+    """
+
+    bytes_compute = _check_sweep_args(
+        bytes_compute, cross_min, cross_max, steps, bytes_per_event,
+    )
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    return _sweep_chunks(
+        bytes_compute, cross_min, cross_max, steps, bytes_per_event,
+        compute, boundary, chunk_size,
+    )
+
+
+def transition_point(
+    *,
+    bytes_compute: int,
+    bytes_per_event: int,
+    compute: ComputeCost,
+    boundary: BoundaryCost,
+) -> int:
+    """Crossing volume at which crossing energy equals compute energy.
+
+    This is where the crossing fraction passes 0.5 (and, for alpha = 0,
+    where the local elasticity does too). Treating events as
+    ``bytes / bytes_per_event``, C_cross = C_intra solves in closed form to
+
+        bytes* = pj_per_byte * bytes_compute / (beta + alpha / bytes_per_event)
+
+    rounded to whole bytes. Use this instead of :func:`sweep` when only the
+    transition is needed.
+    """
+
+    if bytes_per_event <= 0:
+        raise ValueError("bytes_per_event must be > 0")
+
+    per_byte = (
+        boundary.beta_pj_per_byte
+        + boundary.alpha_pj_per_event / bytes_per_event
+    )
+    if per_byte <= 0:
+        raise ValueError("Crossing cost per byte must be > 0")
+
+    return int(round(energy_intra(bytes_compute, compute) / per_byte))
+
+
+def _baseline_arm(
     *,
     bytes_compute: int,
     cross_bytes: int,
     bytes_per_event: int,
-    reduce_factor: float,
     compute: ComputeCost,
     boundary: BoundaryCost,
-) -> dict[str, float]:
-    """Compare baseline crossing volume to a reduced-crossing schedule."""
+) -> tuple[int, float, float, float, float]:
+    """Validate the shared compare arguments and evaluate the baseline.
+
+    Returns (events, c_intra, c_cross, c_total, crossing_fraction).
+    """
 
     if cross_bytes <= 0:
         raise ValueError("cross_bytes must be > 0")
     if bytes_per_event <= 0:
         raise ValueError("bytes_per_event must be > 0")
-    if reduce_factor <= 0:
-        raise ValueError("reduce_factor must be > 0")
 
-    base_ev = max(1, int(math.ceil(cross_bytes / bytes_per_event)))
-    red_bytes = max(1, int(round(cross_bytes / reduce_factor)))
-    red_ev = max(1, int(math.ceil(red_bytes / bytes_per_event)))
+    base_ev = -(-cross_bytes // bytes_per_event) or 1
 
-    base = ProgramPoint(
-        bytes_compute=bytes_compute,
-        bytes_cross=cross_bytes,
-        events_cross=base_ev,
-    )
-    red = ProgramPoint(
-        bytes_compute=bytes_compute,
-        bytes_cross=red_bytes,
-        events_cross=red_ev,
-    )
+    # The compute term is identical for both schedules; only crossing differs.
+    c_intra = energy_intra(bytes_compute, compute)
 
-    base_intra, base_cross, base_total, base_frac = run_point(
-        base, compute, boundary,
-    )
-    red_intra, red_cross, red_total, red_frac = run_point(
-        red, compute, boundary,
+    base_cross = energy_cross(cross_bytes, base_ev, boundary)
+    base_total = c_intra + base_cross
+    return (
+        base_ev, c_intra, base_cross, base_total,
+        crossing_fraction(base_cross, base_total),
     )
 
+
+def _reduced_arm(
+    *,
+    cross_bytes: int,
+    bytes_per_event: int,
+    reduce_factor: float,
+    c_intra: float,
+    base_total: float,
+    boundary: BoundaryCost,
+) -> tuple[int, int, float, float, float, float, float]:
+    """Evaluate one reduced-crossing schedule against a precomputed baseline.
+
+    Returns (bytes, events, c_cross, c_total, crossing_fraction, gain,
+    effective elasticity).
+    """
+
+    red_bytes = max(1, int(round(cross_bytes / reduce_factor)))
+    red_ev = -(-red_bytes // bytes_per_event) or 1
+
+    red_cross = energy_cross(red_bytes, red_ev, boundary)
+    red_total = c_intra + red_cross
+    red_frac = crossing_fraction(red_cross, red_total)
+
     gain = base_total / red_total if red_total > 0 else float("inf")
 
     # "effective elasticity" for the discrete change
@@ -205,15 +440,50 @@ def compare_baseline_vs_reduced(
     if reduce_factor != 1.0 and gain > 0:
         eff_eps = math.log(gain) / math.log(reduce_factor)
 
+    return red_bytes, red_ev, red_cross, red_total, red_frac, gain, eff_eps
+
+
+def compare_baseline_vs_reduced(
+    *,
+    bytes_compute: int,
+    cross_bytes: int,
+    bytes_per_event: int,
+    reduce_factor: float,
+    compute: ComputeCost,
+    boundary: BoundaryCost,
+) -> dict[str, float]:
+    """Compare baseline crossing volume to a reduced-crossing schedule."""
+
+    base_ev, c_intra, base_cross, base_total, base_frac = _baseline_arm(
+        bytes_compute=bytes_compute,
+        cross_bytes=cross_bytes,
+        bytes_per_event=bytes_per_event,
+        compute=compute,
+        boundary=boundary,
+    )
+    if reduce_factor <= 0:
+        raise ValueError("reduce_factor must be > 0")
+
+    red_bytes, red_ev, red_cross, red_total, red_frac, gain, eff_eps = (
+        _reduced_arm(
+            cross_bytes=cross_bytes,
+            bytes_per_event=bytes_per_event,
+            reduce_factor=reduce_factor,
+            c_intra=c_intra,
+            base_total=base_total,
+            boundary=boundary,
+        )
+    )
+
     return {
         "baseline_total_pj": base_total,
-        "baseline_intra_pj": base_intra,
+        "baseline_intra_pj": c_intra,
         "baseline_cross_pj": base_cross,
         "baseline_cross_frac": base_frac,
         "baseline_cross_bytes": float(cross_bytes),
         "baseline_events": float(base_ev),
         "reduced_total_pj": red_total,
-        "reduced_intra_pj": red_intra,
+        "reduced_intra_pj": c_intra,
         "reduced_cross_pj": red_cross,
         "reduced_cross_frac": red_frac,
         "reduced_cross_bytes": float(red_bytes),
@@ -222,3 +492,65 @@ def compare_baseline_vs_reduced(
         "energy_gain_x": gain,
         "elasticity_effective": eff_eps,
     }
+
+
+def compare_sweep(
+    *,
+    bytes_compute: int,
+    cross_bytes: int,
+    bytes_per_event: int,
+    reduce_factors: Sequence[float],
+    compute: ComputeCost,
+    boundary: BoundaryCost,
+) -> dict[str, float | list[float]]:
+    """Compare one baseline against several reduced-crossing schedules.
+
+    Gives the same numbers as calling :func:`compare_baseline_vs_reduced`
+    once per reduce factor, but the baseline is evaluated only once.
+    ``baseline_*`` keys map to scalars; every other key maps to a list
+    aligned with ``reduce_factors``.
+    """
+
+    base_ev, c_intra, base_cross, base_total, base_frac = _baseline_arm(
+        bytes_compute=bytes_compute,
+        cross_bytes=cross_bytes,
+        bytes_per_event=bytes_per_event,
+        compute=compute,
+        boundary=boundary,
+    )
+    # len() rather than truthiness, so NumPy arrays are accepted.
+    if len(reduce_factors) == 0:
+        raise ValueError("reduce_factors must not be empty")
+    if any(rf <= 0 for rf in reduce_factors):
+        raise ValueError("reduce_factors must all be > 0")
+
+    arms = [
+        _reduced_arm(
+            cross_bytes=cross_bytes,
+            bytes_per_event=bytes_per_event,
+            reduce_factor=rf,
+            c_intra=c_intra,
+            base_total=base_total,
+            boundary=boundary,
+        )
+        for rf in reduce_factors
+    ]
+    red_bytes, red_ev, red_cross, red_total, red_frac, gain, eff_eps = zip(*arms)
+
+    return {
+        "baseline_total_pj": base_total,
+        "baseline_intra_pj": c_intra,
+        "baseline_cross_pj": base_cross,
+        "baseline_cross_frac": base_frac,
+        "baseline_cross_bytes": float(cross_bytes),
+        "baseline_events": float(base_ev),
+        "reduced_total_pj": list(red_total),
+        "reduced_intra_pj": [c_intra] * len(arms),
+        "reduced_cross_pj": list(red_cross),
+        "reduced_cross_frac": list(red_frac),
+        "reduced_cross_bytes": [float(b) for b in red_bytes],
+        "reduced_events": [float(ev) for ev in red_ev],
+        "reduce_factor": [float(rf) for rf in reduce_factors],
+        "energy_gain_x": list(gain),
+        "elasticity_effective": list(eff_eps),
+    }
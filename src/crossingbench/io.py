@@ -1,40 +1,133 @@
 from __future__ import annotations
 
-import csv
-from collections.abc import Iterable
+from array import array
+from collections.abc import Iterable, Iterator
+from itertools import chain
 from pathlib import Path
 
-from .core import ResultPoint
+from .core import ResultPoint, SweepResult
 
+_COLUMNS = (
+    "bytes_compute",
+    "bytes_cross",
+    "events_cross",
+    "c_intra_pj",
+    "c_cross_pj",
+    "c_total_pj",
+    "crossing_fraction",
+    "epsilon_local",
+)
+_TYPECODES = ("q", "q", "q", "d", "d", "d", "d", "d")
+_HEADER = ",".join(_COLUMNS) + "\n"
+_BUFFER_SIZE = 1 << 20
+
+# The schema is fixed, so every column is numeric and never needs quoting.
+# Binding the row template's % operator once lets map() format each record
+# with a single C-level call.
+_ROW_FMT = "%d,%d,%d,%.6f,%.6f,%.6f,%.6f,%.6f\n".__mod__
+
+
+def _record(r: ResultPoint) -> tuple[int, int, int, float, float, float, float, float]:
+    return (
+        r.bytes_compute,
+        r.bytes_cross,
+        r.events_cross,
+        r.c_intra_pj,
+        r.c_cross_pj,
+        r.c_total_pj,
+        r.crossing_fraction,
+        r.epsilon_local,
+    )
+
+
+def write_csv(
+    path: str | Path,
+    rows: SweepResult | Iterable[SweepResult] | Iterable[ResultPoint],
+) -> None:
+    """Write a SweepResult, a stream of iter_sweep() chunks, or ResultPoint rows."""
 
-def write_csv(path: str | Path, rows: Iterable[ResultPoint]) -> None:
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
 
-    with p.open("w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow(
-            [
-                "bytes_compute",
-                "bytes_cross",
-                "events_cross",
-                "c_intra_pj",
-                "c_cross_pj",
-                "c_total_pj",
-                "crossing_fraction",
-                "epsilon_local",
-            ]
+    if isinstance(rows, SweepResult):
+        records = zip(*rows.columns)
+    else:
+        records = chain.from_iterable(
+            zip(*r.columns) if isinstance(r, SweepResult) else (_record(r),)
+            for r in rows
         )
-        for r in rows:
-            w.writerow(
-                [
-                    r.bytes_compute,
-                    r.bytes_cross,
-                    r.events_cross,
-                    f"{r.c_intra_pj:.6f}",
-                    f"{r.c_cross_pj:.6f}",
-                    f"{r.c_total_pj:.6f}",
-                    f"{r.crossing_fraction:.6f}",
-                    f"{r.epsilon_local:.6f}",
-                ]
-            )
+
+    # Rows stream through a large write buffer, so memory stays flat however
+    # many rows the iterable produces.
+    with p.open("w", newline="", encoding="utf-8", buffering=_BUFFER_SIZE) as f:
+        f.write(_HEADER)
+        f.writelines(map(_ROW_FMT, records))
+
+
+def _as_chunks(
+    rows: SweepResult | Iterable[SweepResult] | Iterable[ResultPoint],
+    batch: int = 4096,
+) -> Iterator[SweepResult]:
+    """Normalize any write_csv() input into column chunks."""
+
+    if isinstance(rows, SweepResult):
+        yield rows
+        return
+
+    pending: list[ResultPoint] = []
+    for r in rows:
+        if isinstance(r, SweepResult):
+            if pending:
+                yield _rows_to_chunk(pending)
+                pending = []
+            yield r
+        else:
+            pending.append(r)
+            if len(pending) == batch:
+                yield _rows_to_chunk(pending)
+                pending = []
+    if pending:
+        yield _rows_to_chunk(pending)
+
+
+def _rows_to_chunk(rows: list[ResultPoint]) -> SweepResult:
+    return SweepResult(*(
+        array(tc, col)
+        for tc, col in zip(_TYPECODES, zip(*map(_record, rows)))
+    ))
+
+
+def write_parquet(
+    path: str | Path,
+    rows: SweepResult | Iterable[SweepResult] | Iterable[ResultPoint],
+) -> None:
+    """Write the CSV columns as zstd-compressed Parquet; requires ``pyarrow``."""
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Parquet output requires pyarrow: "
+            "pip install 'crossingbench[parquet]'"
+        ) from e
+
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+
+    types = {"q": pa.int64(), "d": pa.float64()}
+    schema = pa.schema(
+        [(name, types[tc]) for name, tc in zip(_COLUMNS, _TYPECODES)]
+    )
+
+    with pq.ParquetWriter(p, schema, compression="zstd") as writer:
+        for chunk in _as_chunks(rows):
+            # array.array buffers are native int64/float64, so Arrow can wrap
+            # them without copying or converting element by element.
+            arrays = [
+                pa.Array.from_buffers(
+                    field.type, len(col), [None, pa.py_buffer(col)],
+                )
+                for field, col in zip(schema, chunk.columns)
+            ]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
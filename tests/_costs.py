@@ -0,0 +1,17 @@
+"""Cost configurations shared by the test modules.
+
+ComputeCost and BoundaryCost are frozen, so one instance serves every test.
+"""
+from __future__ import annotations
+
+from crossingbench.core import BoundaryCost, ComputeCost
+
+CC_QUARTER = ComputeCost(pj_per_byte=0.25)
+CC_ANALOG = ComputeCost(pj_per_byte=0.0001)
+
+B_BETA1 = BoundaryCost(alpha_pj_per_event=0.0, beta_pj_per_byte=1.0)
+B_BETA125 = BoundaryCost(alpha_pj_per_event=0.0, beta_pj_per_byte=1.25)
+B_BETA32 = BoundaryCost(alpha_pj_per_event=0.0, beta_pj_per_byte=3.2)
+B_ALPHA2 = BoundaryCost(alpha_pj_per_event=2.0, beta_pj_per_byte=1.0)
+B_ALPHA40 = BoundaryCost(alpha_pj_per_event=40.0, beta_pj_per_byte=5.0)
+B_ALPHA100 = BoundaryCost(alpha_pj_per_event=100.0, beta_pj_per_byte=3.2)
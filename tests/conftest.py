@@ -0,0 +1,29 @@
+"""Shared fixtures for CrossingBench tests."""
+from __future__ import annotations
+
+import pytest
+from _costs import B_BETA1, B_BETA125, CC_QUARTER
+
+from crossingbench.core import SweepResult, sweep
+
+
+@pytest.fixture(scope="session")
+def sweep_monotonic_grid() -> SweepResult:
+    """10-step memory-boundary sweep shared by the monotonicity tests."""
+    return sweep(
+        bytes_compute=262_144, cross_min=256, cross_max=524_288,
+        steps=10, bytes_per_event=256,
+        compute=CC_QUARTER,
+        boundary=B_BETA125,
+    )
+
+
+@pytest.fixture(scope="session")
+def sweep_small_grid() -> SweepResult:
+    """5-step sweep over 10..1000 bytes shared by the shape tests."""
+    return sweep(
+        bytes_compute=100, cross_min=10, cross_max=1000,
+        steps=5, bytes_per_event=10,
+        compute=CC_QUARTER,
+        boundary=B_BETA1,
+    )
@@ -0,0 +1,46 @@
+"""Tests for CrossingBench CLI helpers."""
+from __future__ import annotations
+
+import argparse
+
+import pytest
+
+from crossingbench.cli import _float_list, _SweepRanges
+from crossingbench.core import DEFAULT_BOUNDARIES, DEFAULT_COMPUTE, iter_sweep, sweep
+
+_SWEEP_ARGS = dict(
+    bytes_compute=262_144, cross_min=7, cross_max=99_991,
+    steps=12, bytes_per_event=100,
+    compute=DEFAULT_COMPUTE["digital"],
+    boundary=DEFAULT_BOUNDARIES["memory"],
+)
+
+
+def test_float_list_parses_factors():
+    assert _float_list("1, 1.5,3,") == [1.0, 1.5, 3.0]
+
+@pytest.mark.parametrize("text", ["", " , ", "1,x"])
+def test_float_list_rejects_bad_input(text):
+    with pytest.raises(argparse.ArgumentTypeError):
+        _float_list(text)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 12])
+def test_sweep_ranges_match_whole_sweep(chunk_size):
+    whole = sweep(**_SWEEP_ARGS)
+    ranges = _SweepRanges()
+    chunks = list(ranges.track(iter_sweep(chunk_size=chunk_size, **_SWEEP_ARGS)))
+    assert sum(len(c) for c in chunks) == len(whole)
+    assert ranges.frac_min == min(whole.crossing_fraction)
+    assert ranges.frac_max == max(whole.crossing_fraction)
+    # The first point's placeholder epsilon of 0.0 must not count.
+    assert ranges.has_eps
+    assert ranges.eps_min == min(whole.epsilon_local[1:])
+    assert ranges.eps_max == max(whole.epsilon_local[1:])
+
+def test_sweep_ranges_single_point_chunk_has_no_eps():
+    ranges = _SweepRanges()
+    first = next(ranges.track(iter_sweep(chunk_size=1, **_SWEEP_ARGS)))
+    assert len(first) == 1
+    assert ranges.frac_min == ranges.frac_max == first.crossing_fraction[0]
+    assert not ranges.has_eps
@@ -1,219 +1,98 @@
 """Comprehensive tests for CrossingBench core."""
 from __future__ import annotations
 
+import math
+
+import pytest
+from _costs import B_ALPHA2, B_BETA1, B_BETA32, B_BETA125, CC_QUARTER
+
 from crossingbench.core import (
     BoundaryCost,
     ComputeCost,
-    compare_baseline_vs_reduced,
     crossing_fraction,
     energy_cross,
     energy_intra,
     log_slope,
-    sweep,
+    transition_point,
 )
 
-# ── Basic energy functions ──
-
-def test_energy_intra_basic():
-    assert energy_intra(100, ComputeCost(pj_per_byte=0.25)) == 25.0
-
-def test_energy_intra_zero():
-    assert energy_intra(0, ComputeCost(pj_per_byte=0.25)) == 0.0
-
-def test_energy_cross_beta_only():
-    b = BoundaryCost(alpha_pj_per_event=0.0, beta_pj_per_byte=3.2)
-    assert energy_cross(1000, 4, b) == 3200.0
-
-def test_energy_cross_alpha_only():
-    b = BoundaryCost(alpha_pj_per_event=100.0, beta_pj_per_byte=0.0)
-    assert energy_cross(1000, 4, b) == 400.0
-
-def test_energy_cross_alpha_and_beta():
-    b = BoundaryCost(alpha_pj_per_event=2.0, beta_pj_per_byte=1.0)
-    assert energy_cross(10, 3, b) == 16.0
-
-
-# ── Crossing fraction ──
-
-def test_crossing_fraction_zero_total():
-    assert crossing_fraction(0.0, 0.0) == 0.0
-
-def test_crossing_fraction_all_crossing():
-    assert crossing_fraction(100.0, 100.0) == 1.0
-
-def test_crossing_fraction_half():
-    assert abs(crossing_fraction(50.0, 100.0) - 0.5) < 1e-10
-
-
-# ── Log slope (elasticity) ──
-
-def test_log_slope_doubling():
-    s = log_slope(1.0, 10.0, 2.0, 20.0)
-    assert abs(s - 1.0) < 1e-10
-
-def test_log_slope_guards():
-    assert log_slope(0.0, 1.0, 2.0, 3.0) == 0.0
-    assert log_slope(1.0, 0.0, 2.0, 3.0) == 0.0
-    assert log_slope(1.0, 1.0, 1.0, 2.0) == 0.0
-
-
-# ── Sweep ──
-
-def test_sweep_monotonic_total():
-    rows = sweep(
-        bytes_compute=262_144, cross_min=256, cross_max=524_288,
-        steps=10, bytes_per_event=256,
-        compute=ComputeCost(pj_per_byte=0.25),
-        boundary=BoundaryCost(alpha_pj_per_event=0.0, beta_pj_per_byte=1.25),
-    )
-    totals = [r.c_total_pj for r in rows]
-    assert all(t2 >= t1 for t1, t2 in zip(totals, totals[1:]))
-
-def test_sweep_crossing_fraction_increases():
-    rows = sweep(
-        bytes_compute=262_144, cross_min=256, cross_max=524_288,
-        steps=10, bytes_per_event=256,
-        compute=ComputeCost(pj_per_byte=0.25),
-        boundary=BoundaryCost(alpha_pj_per_event=0.0, beta_pj_per_byte=1.25),
-    )
-    fracs = [r.crossing_fraction for r in rows]
-    assert all(f2 >= f1 for f1, f2 in zip(fracs, fracs[1:]))
-
-def test_sweep_analog_epsilon_near_one():
-    rows = sweep(
-        bytes_compute=262_144, cross_min=256, cross_max=524_288,
-        steps=12, bytes_per_event=256,
-        compute=ComputeCost(pj_per_byte=0.0001),
-        boundary=BoundaryCost(alpha_pj_per_event=0.0, beta_pj_per_byte=3.2),
-    )
-    eps_vals = [r.epsilon_local for r in rows[1:]]
-    assert all(e > 0.95 for e in eps_vals), f"Expected ε > 0.95, got {eps_vals}"
-
-def test_sweep_correct_length():
-    rows = sweep(
-        bytes_compute=100, cross_min=10, cross_max=1000,
-        steps=5, bytes_per_event=10,
-        compute=ComputeCost(pj_per_byte=0.25),
-        boundary=BoundaryCost(alpha_pj_per_event=0.0, beta_pj_per_byte=1.0),
-    )
-    assert len(rows) == 5
-
-def test_sweep_first_epsilon_zero():
-    rows = sweep(
-        bytes_compute=100, cross_min=10, cross_max=1000,
-        steps=5, bytes_per_event=10,
-        compute=ComputeCost(pj_per_byte=0.25),
-        boundary=BoundaryCost(alpha_pj_per_event=0.0, beta_pj_per_byte=1.0),
-    )
-    assert rows[0].epsilon_local == 0.0
-
-def test_sweep_equal_min_max():
-    rows = sweep(
-        bytes_compute=100, cross_min=1000, cross_max=1000,
-        steps=2, bytes_per_event=256,
-        compute=ComputeCost(pj_per_byte=0.25),
-        boundary=BoundaryCost(alpha_pj_per_event=0.0, beta_pj_per_byte=1.0),
-    )
-    assert len(rows) == 2
-    assert rows[0].bytes_cross == rows[1].bytes_cross
-
-def test_sweep_rejects_steps_1():
-    try:
-        sweep(
-            bytes_compute=100, cross_min=10, cross_max=100, steps=1,
-            bytes_per_event=10, compute=ComputeCost(pj_per_byte=0.25),
-            boundary=BoundaryCost(
-                alpha_pj_per_event=0.0, beta_pj_per_byte=1.0,
-            ),
-        )
-        raise AssertionError("Should have raised ValueError")
-    except ValueError:
-        pass
-
-def test_sweep_rejects_negative_cross():
-    try:
-        sweep(
-            bytes_compute=100, cross_min=-1, cross_max=100, steps=5,
-            bytes_per_event=10, compute=ComputeCost(pj_per_byte=0.25),
-            boundary=BoundaryCost(
-                alpha_pj_per_event=0.0, beta_pj_per_byte=1.0,
-            ),
-        )
-        raise AssertionError("Should have raised ValueError")
-    except ValueError:
-        pass
-
-
-# ── Compare ──
-
-def test_compare_basic_gain():
-    out = compare_baseline_vs_reduced(
-        bytes_compute=262_144, cross_bytes=196_608, bytes_per_event=256,
-        reduce_factor=3.0,
-        compute=ComputeCost(pj_per_byte=0.25),
-        boundary=BoundaryCost(alpha_pj_per_event=0.0, beta_pj_per_byte=3.2),
+# ── Scalar functions: energy, crossing fraction, log slope ──
+
+# Results the arithmetic gives exactly, guard sentinels included.
+EXACT_CASES = [
+    # energy
+    (energy_intra, (100, CC_QUARTER), 25.0),
+    (energy_intra, (0, CC_QUARTER), 0.0),
+    (energy_cross, (1000, 4, B_BETA32), 3200.0),
+    (energy_cross, (1000, 4, BoundaryCost(100.0, 0.0)), 400.0),
+    (energy_cross, (10, 3, B_ALPHA2), 16.0),
+    # crossing fraction
+    (crossing_fraction, (0.0, 0.0), 0.0),
+    (crossing_fraction, (100.0, 100.0), 1.0),
+    # log slope (elasticity) guards
+    (log_slope, (0.0, 1.0, 2.0, 3.0), 0.0),
+    (log_slope, (1.0, 0.0, 2.0, 3.0), 0.0),
+    (log_slope, (1.0, 1.0, 1.0, 2.0), 0.0),
+]
+
+# Results that go through division or logarithms.
+APPROX_CASES = [
+    (crossing_fraction, (50.0, 100.0), 0.5),
+    (log_slope, (1.0, 10.0, 2.0, 20.0), 1.0),
+]
+
+@pytest.mark.parametrize("fn,args,expected", EXACT_CASES)
+def test_scalar_exact(fn, args, expected):
+    assert fn(*args) == expected
+
+@pytest.mark.parametrize("fn,args,expected", APPROX_CASES)
+def test_scalar_approx(fn, args, expected):
+    assert math.isclose(fn(*args), expected, rel_tol=0.0, abs_tol=1e-10)
+
+def test_energy_int_bytes_give_float():
+    assert isinstance(energy_intra(100, CC_QUARTER), float)
+    assert isinstance(energy_cross(10, 3, B_ALPHA2), float)
+    assert isinstance(energy_cross(10, 3, B_BETA1), float)
+    # Integer costs must still give floats, on both energy_cross paths.
+    assert isinstance(energy_intra(100, ComputeCost(pj_per_byte=1)), float)
+    assert isinstance(energy_cross(10, 3, BoundaryCost(0, 1)), float)
+    assert isinstance(energy_cross(10, 3, BoundaryCost(2, 1)), float)
+
+
+# ── Transition point ──
+
+def test_transition_point_beta_only():
+    b = transition_point(
+        bytes_compute=262_144, bytes_per_event=256,
+        compute=CC_QUARTER,
+        boundary=B_BETA125,
     )
-    assert out["energy_gain_x"] > 1.0
-    assert 0.0 <= out["baseline_cross_frac"] <= 1.0
-    assert 0.0 <= out["reduced_cross_frac"] <= 1.0
-
-def test_compare_elasticity_near_one():
-    out = compare_baseline_vs_reduced(
-        bytes_compute=262_144, cross_bytes=262_144, bytes_per_event=256,
-        reduce_factor=3.0,
-        compute=ComputeCost(pj_per_byte=0.0001),
-        boundary=BoundaryCost(alpha_pj_per_event=0.0, beta_pj_per_byte=3.2),
+    assert b == 52_429
+    frac = crossing_fraction(1.25 * b, 65_536.0 + 1.25 * b)
+    assert math.isclose(frac, 0.5, rel_tol=0.0, abs_tol=1e-5)
+
+def test_transition_point_alpha_lowers_volume():
+    kwargs = dict(
+        bytes_compute=262_144, bytes_per_event=256,
+        compute=CC_QUARTER,
     )
-    assert out["elasticity_effective"] > 0.95
-
-def test_compare_elasticity_near_zero():
-    out = compare_baseline_vs_reduced(
-        bytes_compute=262_144, cross_bytes=1024, bytes_per_event=256,
-        reduce_factor=3.0,
-        compute=ComputeCost(pj_per_byte=0.25),
-        boundary=BoundaryCost(alpha_pj_per_event=0.0, beta_pj_per_byte=1.25),
+    b_no = transition_point(
+        boundary=B_BETA1,
+        **kwargs,
     )
-    assert out["elasticity_effective"] < 0.1
-
-def test_compare_has_all_fields():
-    out = compare_baseline_vs_reduced(
-        bytes_compute=100, cross_bytes=100, bytes_per_event=10,
-        reduce_factor=2.0,
-        compute=ComputeCost(pj_per_byte=0.25),
-        boundary=BoundaryCost(alpha_pj_per_event=0.0, beta_pj_per_byte=1.0),
+    b_yes = transition_point(
+        boundary=BoundaryCost(alpha_pj_per_event=100.0, beta_pj_per_byte=1.0),
+        **kwargs,
     )
-    required = [
-        "baseline_total_pj", "reduced_total_pj", "energy_gain_x",
-        "baseline_cross_frac", "reduced_cross_frac", "elasticity_effective",
-    ]
-    for key in required:
-        assert key in out, f"Missing key: {key}"
-
-def test_compare_rejects_negative_bytes():
-    try:
-        compare_baseline_vs_reduced(
-            bytes_compute=100, cross_bytes=-1, bytes_per_event=256,
-            reduce_factor=3.0,
-            compute=ComputeCost(pj_per_byte=0.25),
+    assert b_no == 65_536
+    assert b_yes == 47_127
+
+def test_transition_point_rejects_free_crossing():
+    with pytest.raises(ValueError):
+        transition_point(
+            bytes_compute=100, bytes_per_event=256,
+            compute=CC_QUARTER,
             boundary=BoundaryCost(
-                alpha_pj_per_event=0.0, beta_pj_per_byte=1.0,
+                alpha_pj_per_event=0.0, beta_pj_per_byte=0.0,
             ),
         )
-        raise AssertionError("Should have raised ValueError")
-    except ValueError:
-        pass
-
-def test_compare_with_alpha():
-    out_no = compare_baseline_vs_reduced(
-        bytes_compute=262_144, cross_bytes=196_608, bytes_per_event=256,
-        reduce_factor=3.0,
-        compute=ComputeCost(pj_per_byte=0.25),
-        boundary=BoundaryCost(alpha_pj_per_event=0.0, beta_pj_per_byte=3.2),
-    )
-    out_yes = compare_baseline_vs_reduced(
-        bytes_compute=262_144, cross_bytes=196_608, bytes_per_event=256,
-        reduce_factor=3.0,
-        compute=ComputeCost(pj_per_byte=0.25),
-        boundary=BoundaryCost(alpha_pj_per_event=100.0, beta_pj_per_byte=3.2),
-    )
-    assert out_yes["baseline_cross_frac"] >= out_no["baseline_cross_frac"]
@@ -0,0 +1,64 @@
+"""Tests for CrossingBench CSV output."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from crossingbench.core import DEFAULT_BOUNDARIES, DEFAULT_COMPUTE, iter_sweep, sweep
+from crossingbench.io import write_csv, write_parquet
+
+DATA = Path(__file__).resolve().parent.parent / "data"
+
+
+def test_write_csv_matches_reference(tmp_path):
+    rows = sweep(
+        bytes_compute=262_144, cross_min=256, cross_max=524_288,
+        steps=12, bytes_per_event=256,
+        compute=DEFAULT_COMPUTE["analog"],
+        boundary=DEFAULT_BOUNDARIES["analog"],
+    )
+    out = tmp_path / "analog.csv"
+    write_csv(out, rows)
+    assert out.read_bytes() == (DATA / "analog.csv").read_bytes()
+
+def test_write_csv_accepts_row_iterable(tmp_path):
+    rows = sweep(
+        bytes_compute=262_144, cross_min=256, cross_max=524_288,
+        steps=12, bytes_per_event=256,
+        compute=DEFAULT_COMPUTE["digital"],
+        boundary=DEFAULT_BOUNDARIES["memory"],
+    )
+    out = tmp_path / "memory.csv"
+    write_csv(out, list(rows))
+    assert out.read_bytes() == (DATA / "memory.csv").read_bytes()
+
+def test_write_csv_accepts_sweep_chunks(tmp_path):
+    chunks = iter_sweep(
+        bytes_compute=262_144, cross_min=256, cross_max=524_288,
+        steps=12, bytes_per_event=256,
+        compute=DEFAULT_COMPUTE["digital"],
+        boundary=DEFAULT_BOUNDARIES["chiplet"],
+        chunk_size=5,
+    )
+    out = tmp_path / "chiplet.csv"
+    write_csv(out, chunks)
+    assert out.read_bytes() == (DATA / "chiplet.csv").read_bytes()
+
+def test_write_parquet_round_trips_columns(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    rows = sweep(
+        bytes_compute=262_144, cross_min=7, cross_max=99_991,
+        steps=37, bytes_per_event=100,
+        compute=DEFAULT_COMPUTE["digital"],
+        boundary=DEFAULT_BOUNDARIES["chiplet"],
+    )
+    out = tmp_path / "sweep.parquet"
+    write_parquet(out, list(rows))
+    table = pq.read_table(out)
+    assert table.column_names == [
+        "bytes_compute", "bytes_cross", "events_cross", "c_intra_pj",
+        "c_cross_pj", "c_total_pj", "crossing_fraction", "epsilon_local",
+    ]
+    for name in table.column_names:
+        assert table.column(name).to_pylist() == list(getattr(rows, name))
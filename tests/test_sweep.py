@@ -0,0 +1,335 @@
+"""Tests for CrossingBench sweeps and baseline-vs-reduced comparisons."""
+from __future__ import annotations
+
+import math
+import operator
+
+import pytest
+from _costs import (
+    B_ALPHA2,
+    B_ALPHA40,
+    B_ALPHA100,
+    B_BETA1,
+    B_BETA32,
+    B_BETA125,
+    CC_ANALOG,
+    CC_QUARTER,
+)
+
+from crossingbench.core import (
+    BoundaryCost,
+    ComputeCost,
+    SweepResult,
+    _log_grid,
+    compare_baseline_vs_reduced,
+    compare_sweep,
+    iter_sweep,
+    log_slope,
+    sweep,
+)
+
+# ── Sweep ──
+
+def test_sweep_monotonic_total(sweep_monotonic_grid):
+    totals = sweep_monotonic_grid.c_total_pj
+    assert all(map(operator.le, totals, totals[1:]))
+
+def test_sweep_crossing_fraction_increases(sweep_monotonic_grid):
+    fracs = sweep_monotonic_grid.crossing_fraction
+    assert all(map(operator.le, fracs, fracs[1:]))
+
+def test_sweep_analog_epsilon_near_one():
+    rows = sweep(
+        bytes_compute=262_144, cross_min=256, cross_max=524_288,
+        steps=12, bytes_per_event=256,
+        compute=CC_ANALOG,
+        boundary=B_BETA32,
+    )
+    eps_vals = rows.epsilon_local[1:]
+    assert all(e > 0.95 for e in eps_vals), f"Expected ε > 0.95, got {eps_vals}"
+
+def test_sweep_correct_length(sweep_small_grid):
+    assert len(sweep_small_grid) == 5
+
+def test_sweep_first_epsilon_zero(sweep_small_grid):
+    assert sweep_small_grid.epsilon_local[0] == 0.0
+
+def test_sweep_equal_min_max():
+    rows = sweep(
+        bytes_compute=100, cross_min=1000, cross_max=1000,
+        steps=2, bytes_per_event=256,
+        compute=CC_QUARTER,
+        boundary=B_BETA1,
+    )
+    assert len(rows) == 2
+    assert rows.bytes_cross[0] == rows.bytes_cross[1]
+
+def test_sweep_accepts_float_inputs():
+    rows = sweep(
+        bytes_compute=1e5, cross_min=10, cross_max=1000,
+        steps=5, bytes_per_event=10.0,
+        compute=CC_QUARTER,
+        boundary=B_ALPHA2,
+    )
+    ref = sweep(
+        bytes_compute=100_000, cross_min=10, cross_max=1000,
+        steps=5, bytes_per_event=10,
+        compute=CC_QUARTER,
+        boundary=B_ALPHA2,
+    )
+    assert rows == ref
+
+def test_sweep_columns_match_rows():
+    res = sweep(
+        bytes_compute=100, cross_min=10, cross_max=1000,
+        steps=5, bytes_per_event=10,
+        compute=CC_QUARTER,
+        boundary=B_ALPHA2,
+    )
+    assert list(res.c_total_pj) == [r.c_total_pj for r in res]
+    assert list(res.epsilon_local[1:]) == [r.epsilon_local for r in res[1:]]
+    assert res[-1].bytes_cross == res.bytes_cross[-1] == 1000
+
+def test_sweep_grid_matches_log_exp_grid():
+    # The grid is the rounded log-spaced formula, including exactly
+    # geometric ranges and endpoints far past 2**47.
+    for lo, hi, steps in [
+        (256, 524_288, 12), (10, 1000, 3), (1, 3**10, 11),
+        (7, 7, 4), (1, 2**32, 33), (10, 1000, 5), (7, 99_991, 37),
+        (1, 2**60, 61), (1, 10**15, 16),
+    ]:
+        rows = sweep(
+            bytes_compute=100, cross_min=lo, cross_max=hi,
+            steps=steps, bytes_per_event=10,
+            compute=CC_QUARTER,
+            boundary=B_BETA1,
+        )
+        span = math.log(hi) - math.log(lo)
+        expected = [
+            int(round(math.exp(math.log(lo) + (i / (steps - 1)) * span)))
+            for i in range(steps)
+        ]
+        assert list(rows.bytes_cross) == expected
+
+def test_sweep_slice_stays_columnar():
+    res = sweep(
+        bytes_compute=100, cross_min=10, cross_max=1000,
+        steps=5, bytes_per_event=10,
+        compute=CC_QUARTER,
+        boundary=B_BETA1,
+    )
+    tail = res[1:]
+    assert isinstance(tail, SweepResult)
+    assert len(tail) == 4
+    assert tail[0] == res[1]
+
+def test_sweep_epsilon_matches_log_slope():
+    res = sweep(
+        bytes_compute=262_144, cross_min=7, cross_max=99_991,
+        steps=37, bytes_per_event=100,
+        compute=CC_QUARTER,
+        boundary=B_ALPHA40,
+    )
+    expected = [0.0] + [
+        log_slope(b0, t0, b1, t1)
+        for b0, b1, t0, t1 in zip(
+            res.bytes_cross, res.bytes_cross[1:],
+            res.c_total_pj, res.c_total_pj[1:],
+        )
+    ]
+    assert list(res.epsilon_local) == expected
+
+def test_sweep_zero_byte_grid_point():
+    res = sweep(
+        bytes_compute=100, cross_min=0.4, cross_max=10,
+        steps=5, bytes_per_event=10,
+        compute=CC_QUARTER,
+        boundary=B_BETA1,
+    )
+    assert list(res.bytes_cross) == [0, 1, 2, 4, 10]
+    expected = [0.0] + [
+        log_slope(b0, t0, b1, t1)
+        for b0, b1, t0, t1 in zip(
+            res.bytes_cross, res.bytes_cross[1:],
+            res.c_total_pj, res.c_total_pj[1:],
+        )
+    ]
+    assert list(res.epsilon_local) == expected
+    assert res.epsilon_local[1] == 0.0
+
+def test_iter_sweep_chunks_bypass_grid_cache():
+    kwargs = dict(
+        bytes_compute=100, cross_min=3, cross_max=30_000, steps=20,
+        bytes_per_event=10, compute=CC_QUARTER, boundary=B_BETA1,
+    )
+    before = _log_grid.cache_info()
+    for _ in iter_sweep(chunk_size=7, **kwargs):
+        pass
+    assert _log_grid.cache_info() == before
+    sweep(**kwargs)
+    sweep(**kwargs)
+    after = _log_grid.cache_info()
+    assert (after.hits, after.misses) == (before.hits + 1, before.misses + 1)
+
+def test_iter_sweep_chunks_concatenate_to_sweep():
+    for lo, hi in [(7, 99_991), (256, 524_288)]:
+        kwargs = dict(
+            bytes_compute=262_144, cross_min=lo, cross_max=hi,
+            steps=12, bytes_per_event=100,
+            compute=CC_QUARTER,
+            boundary=B_ALPHA40,
+        )
+        whole = sweep(**kwargs)
+        for chunk_size in (1, 5, 12, 4096):
+            chunks = list(iter_sweep(chunk_size=chunk_size, **kwargs))
+            assert max(len(c) for c in chunks) <= chunk_size
+            for name, column in zip(
+                ("bytes_cross", "c_total_pj", "epsilon_local"),
+                (whole.bytes_cross, whole.c_total_pj, whole.epsilon_local),
+            ):
+                joined = [v for c in chunks for v in getattr(c, name)]
+                assert joined == list(column), (chunk_size, name)
+
+
+# ── Compare ──
+
+def test_compare_basic_gain():
+    out = compare_baseline_vs_reduced(
+        bytes_compute=262_144, cross_bytes=196_608, bytes_per_event=256,
+        reduce_factor=3.0,
+        compute=CC_QUARTER,
+        boundary=B_BETA32,
+    )
+    assert out["energy_gain_x"] > 1.0
+    assert 0.0 <= out["baseline_cross_frac"] <= 1.0
+    assert 0.0 <= out["reduced_cross_frac"] <= 1.0
+
+def test_compare_elasticity_near_one():
+    out = compare_baseline_vs_reduced(
+        bytes_compute=262_144, cross_bytes=262_144, bytes_per_event=256,
+        reduce_factor=3.0,
+        compute=CC_ANALOG,
+        boundary=B_BETA32,
+    )
+    assert out["elasticity_effective"] > 0.95
+
+def test_compare_elasticity_near_zero():
+    out = compare_baseline_vs_reduced(
+        bytes_compute=262_144, cross_bytes=1024, bytes_per_event=256,
+        reduce_factor=3.0,
+        compute=CC_QUARTER,
+        boundary=B_BETA125,
+    )
+    assert out["elasticity_effective"] < 0.1
+
+def test_compare_has_all_fields():
+    out = compare_baseline_vs_reduced(
+        bytes_compute=100, cross_bytes=100, bytes_per_event=10,
+        reduce_factor=2.0,
+        compute=CC_QUARTER,
+        boundary=B_BETA1,
+    )
+    required = [
+        "baseline_total_pj", "reduced_total_pj", "energy_gain_x",
+        "baseline_cross_frac", "reduced_cross_frac", "elasticity_effective",
+    ]
+    for key in required:
+        assert key in out, f"Missing key: {key}"
+
+def test_compare_with_alpha():
+    out_no = compare_baseline_vs_reduced(
+        bytes_compute=262_144, cross_bytes=196_608, bytes_per_event=256,
+        reduce_factor=3.0,
+        compute=CC_QUARTER,
+        boundary=B_BETA32,
+    )
+    out_yes = compare_baseline_vs_reduced(
+        bytes_compute=262_144, cross_bytes=196_608, bytes_per_event=256,
+        reduce_factor=3.0,
+        compute=CC_QUARTER,
+        boundary=B_ALPHA100,
+    )
+    assert out_yes["baseline_cross_frac"] >= out_no["baseline_cross_frac"]
+
+def test_compare_sweep_matches_single_compares():
+    kwargs = dict(
+        bytes_compute=262_144, cross_bytes=196_608, bytes_per_event=256,
+        compute=CC_QUARTER,
+        boundary=B_ALPHA100,
+    )
+    factors = [1.0, 1.5, 3.0, 1000.0]
+    out = compare_sweep(reduce_factors=factors, **kwargs)
+    for i, rf in enumerate(factors):
+        single = compare_baseline_vs_reduced(reduce_factor=rf, **kwargs)
+        for key, value in single.items():
+            got = out[key] if key.startswith("baseline_") else out[key][i]
+            assert got == value, key
+
+def test_compare_sweep_accepts_numpy_array():
+    np = pytest.importorskip("numpy")
+    kwargs = dict(
+        bytes_compute=262_144, cross_bytes=196_608, bytes_per_event=256,
+        compute=CC_QUARTER,
+        boundary=B_ALPHA100,
+    )
+    factors = [1.0, 1.5, 3.0, 1000.0]
+    out = compare_sweep(reduce_factors=np.array(factors), **kwargs)
+    assert out == compare_sweep(reduce_factors=factors, **kwargs)
+
+def test_compare_int_costs_give_floats():
+    out = compare_baseline_vs_reduced(
+        bytes_compute=100, cross_bytes=100, bytes_per_event=10,
+        reduce_factor=2,
+        compute=ComputeCost(pj_per_byte=1),
+        boundary=BoundaryCost(alpha_pj_per_event=0, beta_pj_per_byte=1),
+    )
+    assert all(type(v) is float for v in out.values()), out
+
+def test_compare_event_count_rounds_up():
+    for cross_bytes, events in [(1, 1), (255, 1), (256, 1), (257, 2), (512, 2)]:
+        out = compare_baseline_vs_reduced(
+            bytes_compute=100, cross_bytes=cross_bytes, bytes_per_event=256,
+            reduce_factor=1.0,
+            compute=CC_QUARTER,
+            boundary=BoundaryCost(alpha_pj_per_event=1.0, beta_pj_per_byte=1.0),
+        )
+        assert out["baseline_events"] == events
+
+
+# ── Argument validation ──
+
+_SWEEP_ARGS = dict(
+    bytes_compute=100, cross_min=10, cross_max=100, steps=5,
+    bytes_per_event=10, compute=CC_QUARTER, boundary=B_BETA1,
+)
+_COMPARE_ARGS = dict(
+    bytes_compute=100, cross_bytes=1000, bytes_per_event=256,
+    compute=CC_QUARTER, boundary=B_BETA1,
+)
+
+# (function, valid kwargs, overrides that must raise ValueError)
+REJECT_CASES = [
+    (sweep, _SWEEP_ARGS, {"steps": 1}),
+    (sweep, _SWEEP_ARGS, {"cross_min": -1}),
+    (sweep, _SWEEP_ARGS, {"cross_min": 0}),
+    (sweep, _SWEEP_ARGS, {"cross_min": 200, "cross_max": 100}),
+    (sweep, _SWEEP_ARGS, {"bytes_per_event": 0}),
+    (sweep, _SWEEP_ARGS, {"bytes_compute": 100.5}),
+    (iter_sweep, _SWEEP_ARGS, {"steps": 1}),
+    (iter_sweep, _SWEEP_ARGS, {"chunk_size": 0}),
+    (compare_baseline_vs_reduced, {**_COMPARE_ARGS, "reduce_factor": 3.0},
+     {"cross_bytes": -1}),
+    (compare_baseline_vs_reduced, {**_COMPARE_ARGS, "reduce_factor": 3.0},
+     {"bytes_per_event": 0}),
+    (compare_baseline_vs_reduced, {**_COMPARE_ARGS, "reduce_factor": 3.0},
+     {"reduce_factor": 0.0}),
+    (compare_sweep, {**_COMPARE_ARGS, "reduce_factors": [3.0]},
+     {"reduce_factors": []}),
+    (compare_sweep, {**_COMPARE_ARGS, "reduce_factors": [3.0]},
+     {"reduce_factors": [2.0, 0.0]}),
+]
+
+@pytest.mark.parametrize("fn,base,overrides", REJECT_CASES)
+def test_rejects_invalid(fn, base, overrides):
+    with pytest.raises(ValueError):
+        fn(**{**base, **overrides})